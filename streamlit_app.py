@@ -1,28 +1,26 @@
 import os
-import pandas as pd
+import io
+import csv
 import requests
-import datetime
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from datetime import date
 import streamlit as st
-import json
 import time
-from pathlib import Path
-from typing import Dict, List, Optional
+import threading
+from typing import Dict, Iterator, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 import logging
+import orjson
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Page configuration
-st.set_page_config(
-    page_title="Professional Contact Finder - Real API Integration",
-    page_icon="🔍",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
-
-# Custom CSS
-st.markdown("""
+# Static page styling; Streamlit re-runs this script, so it is rebuilt each run
+CUSTOM_CSS = """
 <style>
     .main-header {
         font-size: 2.5rem !important;
@@ -45,104 +43,282 @@ st.markdown("""
         border-radius: 0.5rem;
         margin: 1rem 0;
     }
+    .metrics-row {
+        display: flex;
+        gap: 1rem;
+        margin: 1rem 0;
+    }
+    .metric-container {
+        flex: 1;
+        background-color: #f0f2f6;
+        padding: 1rem;
+        border-radius: 0.5rem;
+    }
+    .metric-label { font-size: 0.9rem; color: #555; }
+    .metric-value { font-size: 1.8rem; font-weight: 600; color: #262730; }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Result table layout shared by the display and the download
+RESULT_COLUMNS = (
+    "Date of Scraping", "Sr No", "City", "LinkedIn Profile Link",
+    "Name", "Mobile Number", "Email Id", "Organization Name", "Data Source"
+)
+
+# Compact dtypes: categories for repeated values, Arrow-backed strings for
+# per-contact text so st.dataframe can hand the columns to Arrow directly
+RESULT_DTYPES = {
+    "Date of Scraping": "category",
+    "Sr No": "int32",
+    "City": "category",
+    "LinkedIn Profile Link": "string[pyarrow]",
+    "Name": "string[pyarrow]",
+    "Mobile Number": "string[pyarrow]",
+    "Email Id": "string[pyarrow]",
+    "Organization Name": "category",
+    "Data Source": "category",
+}
+
+LINKEDIN_SEARCH_URL = "https://linkedin.com/search/results/people/?keywords="
+URL_SPACE_TABLE = str.maketrans({' ': '%20'})
+NO_SPACE_TABLE = str.maketrans('', '', ' \t')
+
+# Sidebar options as tuples; like every constant in this script they are rebuilt on each rerun
+# Indian cities with major tech hubs
+CITIES: Tuple[str, ...] = (
+    "Mumbai", "Bangalore", "Delhi", "Hyderabad", "Chennai", 
+    "Pune", "Kolkata", "Gurgaon", "Noida", "Kochi"
+)
+
+JOB_ROLES: Tuple[str, ...] = (
+    "Data Scientist", "Senior Data Scientist", "Machine Learning Engineer",
+    "Data Engineer", "Senior Data Engineer", "Data Analyst",
+    "Business Intelligence Analyst", "Analytics Engineer",
+    "Big Data Engineer", "AI Engineer"
+)
+
+SKILLS: Tuple[str, ...] = (
+    "Python", "R", "SQL", "Machine Learning", "Deep Learning",
+    "AWS", "Azure", "Spark", "Hadoop", "Tableau", "Power BI"
+)
+
+API_SOURCES: Tuple[str, ...] = ("Apollo.io", "Hunter.io + Manual", "Mixed Sources")
+
+# Rows shown per page of the results table
+RESULTS_PAGE_SIZE = 25
+
+# Seconds a finished search is reused for identical inputs
+SEARCH_CACHE_TTL = 600
+
+# Page configuration
+st.set_page_config(
+    page_title="Professional Contact Finder - Real API Integration",
+    page_icon="🔍",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+# Custom CSS
+st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
+
+class CappedRetry(Retry):
+    """Retry policy that honors Retry-After but never sleeps longer than MAX_RETRY_AFTER"""
+    
+    MAX_RETRY_AFTER = 5
+    
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, self.MAX_RETRY_AFTER)
 
 class APIManager:
     """Manages all API integrations for professional contact discovery"""
     
+    APOLLO_PAGE_SIZE = 25
+    # Health probes must neither read nor write the response cache
+    NO_STORE_HEADERS = {'Cache-Control': 'no-store'}
+    
     def __init__(self):
         self.hunter_api_key = os.getenv('HUNTER_API_KEY')
         self.apollo_api_key = os.getenv('APOLLO_API_KEY')
         self.clearbit_api_key = os.getenv('CLEARBIT_API_KEY')
         self.rapidapi_key = os.getenv('RAPIDAPI_KEY')
-    
-    def test_api_connections(self) -> Dict[str, bool]:
-        """Test all API connections and return status"""
-        status = {}
         
-        # Test Hunter.io
-        if self.hunter_api_key:
-            try:
-                response = requests.get(
-                    f"https://api.hunter.io/v2/account?api_key={self.hunter_api_key}",
-                    timeout=10
-                )
-                status['hunter'] = response.status_code == 200
-            except:
-                status['hunter'] = False
-        else:
-            status['hunter'] = False
-        
-        # Test Apollo.io
-        if self.apollo_api_key:
-            try:
-                headers = {'X-Api-Key': self.apollo_api_key}
-                response = requests.get(
-                    "https://api.apollo.io/v1/auth/health",
-                    headers=headers,
-                    timeout=10
-                )
-                status['apollo'] = response.status_code == 200
-            except:
-                status['apollo'] = False
-        else:
-            status['apollo'] = False
-        
-        # Test Clearbit
-        if self.clearbit_api_key:
-            try:
-                response = requests.get(
-                    "https://company.clearbit.com/v1/domains/find?name=google.com",
-                    headers={'Authorization': f'Bearer {self.clearbit_api_key}'},
-                    timeout=10
-                )
-                status['clearbit'] = response.status_code == 200
-            except:
-                status['clearbit'] = False
-        else:
-            status['clearbit'] = False
-        
-        return status
+        # Shared session so every call reuses pooled keep-alive connections.
+        # Responses are cached on disk per provider; Apollo POST bodies are
+        # part of the cache key, so distinct searches never collide. The Apollo
+        # key header is redacted from the store alongside the default secrets.
+        self.session = requests_cache.CachedSession(
+            'contact_cache.sqlite',
+            ignored_parameters=(*requests_cache.settings.DEFAULT_IGNORED_PARAMS, 'X-Api-Key'),
+            expire_after=3600,
+            urls_expire_after={
+                '*.hunter.io': 86400,
+                '*.clearbit.com': 86400 * 7,
+                '*.apollo.io': 600,
+            },
+            allowable_methods=('GET', 'POST'),
+            stale_if_error=True
+        )
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            # Only throttling statuses get the full retry budget; a timed-out
+            # read is never repeated and a failed connect is tried once more
+            max_retries=CappedRetry(
+                total=5,
+                connect=1,
+                read=0,
+                status=5,
+                backoff_factor=0.5,
+                status_forcelist=[429, 503],
+                respect_retry_after_header=True
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({
+            'User-Agent': 'ProfessionalContactFinder/3.0',
+            'Accept': 'application/json'
+        })
+        # Cap in-flight requests per provider to stay under their rate limits
+        self._semaphores = {
+            'hunter': threading.BoundedSemaphore(5),
+            'clearbit': threading.BoundedSemaphore(8),
+            'apollo': threading.BoundedSemaphore(3)
+        }
+        self._json_headers = {
+            'X-Api-Key': self.apollo_api_key or '',
+            'Accept': 'application/json',
+            'Content-Type': 'application/json'
+        }
     
-    def search_professionals_apollo(self, city: str, job_titles: List[str], 
-                                  skills: List[str], limit: int = 20) -> List[Dict]:
-        """Search for professionals using Apollo.io API"""
+    def close(self):
+        """Close the shared HTTP session and its connection pool"""
+        self.session.close()
+    
+    def __del__(self):
+        session = getattr(self, 'session', None)
+        if session is not None:
+            session.close()
+    
+    @staticmethod
+    def _log_cache(api_name: str, response: requests.Response):
+        """Log whether a response was served from the local cache"""
+        cache_status = 'HIT' if getattr(response, 'from_cache', False) else 'MISS'
+        logger.info(f"{api_name} X-Cache: {cache_status}")
+    
+    def _post_json(self, url: str, payload: Dict, timeout: int) -> requests.Response:
+        """POST a JSON body serialized with orjson"""
+        return self.session.post(
+            url,
+            data=orjson.dumps(payload),
+            headers=self._json_headers,
+            timeout=timeout
+        )
+    
+    def _test_hunter(self) -> Tuple[str, bool]:
+        """Probe the Hunter.io account endpoint"""
+        if not self.hunter_api_key:
+            return 'hunter', False
+        try:
+            response = self.session.get(
+                f"https://api.hunter.io/v2/account?api_key={self.hunter_api_key}",
+                headers=self.NO_STORE_HEADERS,
+                timeout=10
+            )
+            return 'hunter', response.status_code == 200
+        except Exception:
+            return 'hunter', False
+    
+    def _test_apollo(self) -> Tuple[str, bool]:
+        """Probe the Apollo.io health endpoint"""
         if not self.apollo_api_key:
-            return []
-        
+            return 'apollo', False
         try:
-            headers = {
-                'X-Api-Key': self.apollo_api_key,
-                'Content-Type': 'application/json'
-            }
-            
-            # Construct search query
-            payload = {
-                'q_person_title': ' OR '.join(job_titles),
-                'q_person_location': city,
-                'page_size': limit,
-                'person_seniorities': ['senior', 'director', 'manager', 'individual_contributor']
-            }
-            
-            response = requests.post(
-                'https://api.apollo.io/v1/mixed_people/search',
+            headers = {'X-Api-Key': self.apollo_api_key, **self.NO_STORE_HEADERS}
+            response = self.session.get(
+                "https://api.apollo.io/v1/auth/health",
                 headers=headers,
-                json=payload,
-                timeout=30
+                timeout=10
+            )
+            return 'apollo', response.status_code == 200
+        except Exception:
+            return 'apollo', False
+    
+    def _test_clearbit(self) -> Tuple[str, bool]:
+        """Probe the Clearbit domain-find endpoint"""
+        if not self.clearbit_api_key:
+            return 'clearbit', False
+        try:
+            response = self.session.get(
+                "https://company.clearbit.com/v1/domains/find?name=google.com",
+                headers={'Authorization': f'Bearer {self.clearbit_api_key}',
+                         **self.NO_STORE_HEADERS},
+                timeout=10
             )
+            return 'clearbit', response.status_code == 200
+        except Exception:
+            return 'clearbit', False
+    
+    def test_api_connections(self) -> Dict[str, bool]:
+        """Test all API connections concurrently and return status"""
+        probes = [self._test_hunter, self._test_apollo, self._test_clearbit]
+        with ThreadPoolExecutor(max_workers=len(probes)) as executor:
+            return dict(executor.map(lambda probe: probe(), probes))
+    
+    def _fetch_apollo_page(self, payload: Dict) -> List[Dict]:
+        """Fetch one Apollo search page and return its people"""
+        try:
+            with self._semaphores['apollo']:
+                response = self._post_json(
+                    'https://api.apollo.io/v1/mixed_people/search',
+                    payload,
+                    timeout=30
+                )
+            self._log_cache('Apollo', response)
             
-            if response.status_code == 200:
-                data = response.json()
-                return data.get('people', [])
-            else:
+            if response.status_code != 200:
                 logger.error(f"Apollo API error: {response.status_code}")
                 return []
-                
+            
+            return orjson.loads(response.content).get('people', [])
         except Exception as e:
             logger.error(f"Apollo API exception: {str(e)}")
             return []
     
+    def search_professionals_apollo(self, city: str, job_titles: List[str], 
+                                  skills: List[str], limit: int = 20) -> Iterator[Dict]:
+        """Search for professionals using Apollo.io API, yielding people page by page"""
+        if not self.apollo_api_key or limit <= 0:
+            return
+        
+        # Construct the search query once; only the page number changes per request
+        page_size = min(self.APOLLO_PAGE_SIZE, limit)
+        query = {
+            'q_person_title': ' OR '.join(job_titles),
+            'q_person_location': city,
+            'page_size': page_size,
+            'person_seniorities': ['senior', 'director', 'manager', 'individual_contributor']
+        }
+        payloads = [
+            {**query, 'page': page}
+            for page in range(1, -(-limit // page_size) + 1)
+        ]
+        
+        # Every page is requested at once and yielded in page order. When an
+        # early page comes back short, the later requests are wasted calls.
+        with ThreadPoolExecutor(max_workers=len(payloads)) as executor:
+            pages = [executor.submit(self._fetch_apollo_page, payload) for payload in payloads]
+            yielded = 0
+            for page in pages:
+                people = page.result()[:limit - yielded]
+                yield from people
+                yielded += len(people)
+                if len(people) < page_size:
+                    return
+    
     def find_email_hunter(self, first_name: str, last_name: str, 
                          company_domain: str) -> Optional[str]:
         """Find email using Hunter.io API"""
@@ -158,10 +334,12 @@ class APIManager:
                 'api_key': self.hunter_api_key
             }
             
-            response = requests.get(url, params=params, timeout=15)
+            with self._semaphores['hunter']:
+                response = self.session.get(url, params=params, timeout=15)
+            self._log_cache('Hunter', response)
             
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 email_data = data.get('data', {})
                 if email_data.get('confidence') and email_data.get('confidence') > 50:
                     return email_data.get('email')
@@ -182,10 +360,12 @@ class APIManager:
             params = {'name': company_name}
             headers = {'Authorization': f'Bearer {self.clearbit_api_key}'}
             
-            response = requests.get(url, params=params, headers=headers, timeout=15)
+            with self._semaphores['clearbit']:
+                response = self.session.get(url, params=params, headers=headers, timeout=15)
+            self._log_cache('Clearbit', response)
             
             if response.status_code == 200:
-                return response.json()
+                return orjson.loads(response.content)
             
             return {}
             
@@ -193,8 +373,54 @@ class APIManager:
             logger.error(f"Clearbit API exception: {str(e)}")
             return {}
 
+@st.cache_data(ttl=60, show_spinner=False)
+def get_api_status(_manager: APIManager) -> Dict[str, bool]:
+    """Cached API health check so widget reruns don't re-probe every provider"""
+    return _manager.test_api_connections()
+
+@st.cache_resource
+def get_api_manager() -> APIManager:
+    """Single APIManager (and connection pool) shared by every rerun and session"""
+    return APIManager()
+
+@st.cache_resource
+def get_search_cache() -> Tuple[threading.Lock, Dict[Tuple, Tuple[float, List[Dict]]]]:
+    """Process-wide store of recent search results keyed on the search inputs,
+    with the lock that guards it across session threads"""
+    return threading.Lock(), {}
+
+def change_results_page(step: int):
+    """Button callback that moves the results table by one page"""
+    st.session_state['results_page'] = st.session_state.get('results_page', 0) + step
+
+# Memoizes repeated companies within one search; Streamlit re-runs this
+# script on every rerun, so the memo does not outlive a run
+@lru_cache(maxsize=1024)
+def _guess_domain(company: str) -> str:
+    """Guess a company's email domain from its name"""
+    return company.lower().translate(NO_SPACE_TABLE).removesuffix(',').strip('.') + '.com'
+
+@st.cache_data(ttl=SEARCH_CACHE_TTL, max_entries=32, show_spinner=False)
+def build_df(columns: Tuple[Tuple[str, Tuple], ...]):
+    """Build the results DataFrame from (name, values) column pairs"""
+    import pandas as pd
+    return pd.DataFrame(dict(columns)).astype(RESULT_DTYPES)
+
+@st.cache_data(ttl=SEARCH_CACHE_TTL, max_entries=32, show_spinner=False)
+def build_csv(columns: Tuple[Tuple[str, Tuple], ...]) -> bytes:
+    """Serialize the result columns straight to UTF-8 CSV bytes, bypassing pandas"""
+    names, values = zip(*columns)
+    # Rows are encoded as they are written, so only the byte copy is kept
+    buffer = io.BytesIO()
+    text = io.TextIOWrapper(buffer, encoding='utf-8', newline='', write_through=True)
+    writer = csv.writer(text, lineterminator='\n')
+    writer.writerow(names)
+    writer.writerows(zip(*values))
+    text.flush()
+    return buffer.getvalue()
+
 # Initialize API Manager
-api_manager = APIManager()
+api_manager = get_api_manager()
 
 # Main title
 st.markdown('<h1 class="main-header">🔍 Professional Contact Finder v3.0</h1>', 
@@ -203,66 +429,62 @@ st.markdown("**Real-time professional contact discovery with API integration**")
 
 # API Status Dashboard
 st.sidebar.header("🔌 API Connection Status")
-api_status = api_manager.test_api_connections()
-
-for api_name, is_connected in api_status.items():
-    status_class = "api-connected" if is_connected else "api-error"
-    status_text = "✅ Connected" if is_connected else "❌ Disconnected"
-    st.sidebar.markdown(
-        f'<div class="{status_class}">{api_name.title()}: {status_text}</div>',
-        unsafe_allow_html=True
-    )
+if st.sidebar.button("🔁 Re-check APIs", use_container_width=True):
+    get_api_status.clear()
+api_status = get_api_status(api_manager)
+
+# Render every status badge in a single markdown element
+status_badges = ''.join(
+    f'<div class="{"api-connected" if is_connected else "api-error"}">'
+    f'{api_name.title()}: {"✅ Connected" if is_connected else "❌ Disconnected"}</div>'
+    for api_name, is_connected in api_status.items()
+)
+st.sidebar.markdown(status_badges, unsafe_allow_html=True)
 
 # Configuration sidebar
 st.sidebar.header("🎯 Search Configuration")
 
-# Indian cities with major tech hubs
-cities = [
-    "Mumbai", "Bangalore", "Delhi", "Hyderabad", "Chennai", 
-    "Pune", "Kolkata", "Gurgaon", "Noida", "Kochi"
-]
-
-job_roles = [
-    "Data Scientist", "Senior Data Scientist", "Machine Learning Engineer",
-    "Data Engineer", "Senior Data Engineer", "Data Analyst",
-    "Business Intelligence Analyst", "Analytics Engineer",
-    "Big Data Engineer", "AI Engineer"
-]
-
-skills = [
-    "Python", "R", "SQL", "Machine Learning", "Deep Learning",
-    "AWS", "Azure", "Spark", "Hadoop", "Tableau", "Power BI"
-]
-
-# User inputs
-selected_city = st.sidebar.selectbox("📍 Target City", cities)
-selected_roles = st.sidebar.multiselect("💼 Job Roles", job_roles, default=job_roles[:2])
-selected_skills = st.sidebar.multiselect("🛠️ Required Skills", skills, default=skills[:3])
-max_results = st.sidebar.slider("📊 Number of Results", 5, 50, 10)
-
-# API preference
-api_preference = st.sidebar.selectbox(
-    "🔧 Primary API Source",
-    ["Apollo.io", "Hunter.io + Manual", "Mixed Sources"]
-)
-
-# Search functionality
-col1, col2 = st.columns([3, 1])
+# User inputs, batched in a form so the script only reruns on submit
+with st.sidebar.form("search_form"):
+    selected_city = st.selectbox("📍 Target City", CITIES)
+    selected_roles = st.multiselect("💼 Job Roles", JOB_ROLES, default=JOB_ROLES[:2])
+    selected_skills = st.multiselect("🛠️ Required Skills", SKILLS, default=SKILLS[:3])
+    max_results = st.slider("📊 Number of Results", 5, 50, 10)
+    
+    # API preference
+    api_preference = st.selectbox(
+        "🔧 Primary API Source",
+        API_SOURCES
+    )
+    
+    search_button = st.form_submit_button("🚀 Search Real Professionals", type="primary", 
+                                          use_container_width=True)
 
-with col1:
-    search_button = st.button("🚀 Search Real Professionals", type="primary", 
-                             use_container_width=True)
+# Reset stays outside the form so it works without submitting; the wide
+# empty column only pushes it to the right edge
+_, reset_col = st.columns([3, 1])
 
-with col2:
+with reset_col:
     if st.button("🔄 Reset", use_container_width=True):
-        st.experimental_rerun()
+        st.session_state.pop('search_results', None)
+        st.rerun()
 
 # Main search logic
 if search_button:
+    search_key = (
+        selected_city, tuple(selected_roles), tuple(selected_skills), max_results,
+        tuple(api for api, is_connected in api_status.items() if is_connected)
+    )
+    previous_results = st.session_state.get('search_results')
+    
     if not selected_roles:
         st.error("⚠️ Please select at least one job role")
     elif not any(api_status.values()):
         st.error("⚠️ No API connections available. Please configure API keys.")
+    elif (previous_results and previous_results['key'] == search_key
+          and time.time() - previous_results['searched_at'] < SEARCH_CACHE_TTL):
+        # The results on screen already answer this search; keep them as-is
+        pass
     else:
         # Progress tracking
         progress_bar = st.progress(0)
@@ -270,134 +492,213 @@ if search_button:
         
         all_contacts = []
         
-        # Step 1: Search with Apollo.io
-        if api_status.get('apollo'):
-            status_text.text("🔍 Searching Apollo.io database...")
-            progress_bar.progress(25)
-            
-            apollo_results = api_manager.search_professionals_apollo(
-                selected_city, selected_roles, selected_skills, max_results
-            )
-            
-            for person in apollo_results:
-                contact = {
-                    'name': f"{person.get('first_name', '')} {person.get('last_name', '')}".strip(),
-                    'title': person.get('title', ''),
-                    'company': person.get('organization', {}).get('name', ''),
-                    'location': person.get('city', selected_city),
-                    'linkedin_url': person.get('linkedin_url', ''),
-                    'email': person.get('email', ''),
-                    'phone': person.get('phone_numbers', [{}])[0].get('raw_number', '') if person.get('phone_numbers') else '',
-                    'source': 'Apollo.io'
-                }
-                all_contacts.append(contact)
+        # Identical searches within the TTL reuse the finished contact list
+        search_cache_lock, search_cache = get_search_cache()
+        with search_cache_lock:
+            cached_search = search_cache.get(search_key)
+        
+        if cached_search and time.time() - cached_search[0] < SEARCH_CACHE_TTL:
+            fetched_at, all_contacts = cached_search
         
-        # Step 2: Enhance with Hunter.io emails
-        if api_status.get('hunter') and all_contacts:
-            status_text.text("📧 Enhancing email data with Hunter.io...")
-            progress_bar.progress(50)
+        # Apollo.io discovery streams contacts page by page; Hunter.io email
+        # and Clearbit company lookups are dispatched as each contact arrives
+        elif api_status.get('apollo'):
+            status_text.text("🔍 Searching Apollo.io and enriching contacts...")
+            progress_bar.progress(10)
             
-            for contact in all_contacts:
-                if not contact['email'] and contact['company']:
-                    # Extract company domain
-                    company_domain = f"{contact['company'].lower().replace(' ', '')}.com"
+            use_hunter = api_status.get('hunter')
+            use_clearbit = api_status.get('clearbit')
+            pending = {}
+            company_futures = {}
+            company_cache: Dict[str, Dict] = {}
+            
+            with ThreadPoolExecutor(max_workers=16) as executor:
+                for person in api_manager.search_professionals_apollo(
+                    selected_city, selected_roles, selected_skills, max_results
+                ):
+                    contact = {
+                        'name': f"{person.get('first_name', '')} {person.get('last_name', '')}".strip(),
+                        'title': person.get('title', ''),
+                        'company': person.get('organization', {}).get('name', ''),
+                        'location': person.get('city', selected_city),
+                        'linkedin_url': person.get('linkedin_url', ''),
+                        'email': person.get('email', ''),
+                        'phone': person.get('phone_numbers', [{}])[0].get('raw_number', '') if person.get('phone_numbers') else '',
+                        'source': 'Apollo.io'
+                    }
+                    idx = len(all_contacts)
+                    all_contacts.append(contact)
+                    
+                    if use_hunter and not contact['email'] and contact['company']:
+                        names = contact['name'].split()
+                        if len(names) >= 2:
+                            future = executor.submit(
+                                api_manager.find_email_hunter,
+                                names[0], names[-1], _guess_domain(contact['company'])
+                            )
+                            pending[future] = ('hunter', idx)
                     
-                    names = contact['name'].split()
-                    if len(names) >= 2:
-                        first_name, last_name = names[0], names[-1]
-                        enhanced_email = api_manager.find_email_hunter(
-                            first_name, last_name, company_domain
-                        )
+                    # One Clearbit lookup per unique company
+                    company = contact['company']
+                    if use_clearbit and company and company not in company_futures:
+                        future = executor.submit(api_manager.enrich_company_clearbit, company)
+                        company_futures[company] = future
+                        pending[future] = ('clearbit', company)
+                
+                if pending:
+                    status_text.text("📧 Enhancing emails and 🏢 company information...")
+                    progress_bar.progress(25)
+                
+                for completed, future in enumerate(as_completed(pending), 1):
+                    kind, key = pending[future]
+                    if kind == 'hunter':
+                        enhanced_email = future.result()
                         if enhanced_email:
-                            contact['email'] = enhanced_email
-                            contact['source'] += ' + Hunter.io'
-        
-        # Step 3: Enrich company data
-        if api_status.get('clearbit') and all_contacts:
-            status_text.text("🏢 Enriching company information...")
-            progress_bar.progress(75)
+                            all_contacts[key]['email'] = enhanced_email
+                            all_contacts[key]['source'] += ' + Hunter.io'
+                    else:
+                        company_cache[key] = future.result()
+                    progress_bar.progress(25 + int(70 * completed / len(pending)))
             
             for contact in all_contacts:
-                if contact['company']:
-                    company_data = api_manager.enrich_company_clearbit(contact['company'])
-                    if company_data:
-                        contact['company_size'] = company_data.get('metrics', {}).get('employees', '')
-                        contact['company_industry'] = company_data.get('category', {}).get('industry', '')
+                company_data = company_cache.get(contact['company'])
+                if company_data:
+                    contact['company_size'] = company_data.get('metrics', {}).get('employees', '')
+                    contact['company_industry'] = company_data.get('category', {}).get('industry', '')
+            
+            if all_contacts:
+                fetched_at = time.time()
+                with search_cache_lock:
+                    for key in [k for k, (ts, _) in search_cache.items()
+                                if fetched_at - ts >= SEARCH_CACHE_TTL]:
+                        del search_cache[key]
+                    search_cache[search_key] = (fetched_at, all_contacts)
         
-        # Step 4: Format results
+        # Format results
         status_text.text("📊 Formatting results...")
         progress_bar.progress(100)
         
         if all_contacts:
-            # Create DataFrame
-            formatted_data = []
-            for i, contact in enumerate(all_contacts, 1):
-                formatted_data.append([
-                    datetime.date.today().strftime("%Y-%m-%d"),
-                    i,
-                    selected_city,
-                    contact.get('linkedin_url', f"https://linkedin.com/search/results/people/?keywords={contact['name'].replace(' ', '%20')}"),
-                    contact['name'],
-                    contact.get('phone', 'Not Available'),
-                    contact.get('email', 'Not Available'),
-                    contact['company'],
-                    contact.get('source', 'API')
-                ])
+            # Create DataFrame column-wise in a single pass over the contacts
+            today = date.today()
+            today_iso = today.strftime("%Y-%m-%d")
+            n_contacts = len(all_contacts)
+            links, names, phones, emails, companies, sources = [], [], [], [], [], []
+            for contact in all_contacts:
+                # Fall back to a LinkedIn people search when there is no profile URL
+                links.append(
+                    contact.get('linkedin_url')
+                    or LINKEDIN_SEARCH_URL + contact['name'].translate(URL_SPACE_TABLE)
+                )
+                names.append(contact['name'])
+                phones.append(contact.get('phone', 'Not Available'))
+                emails.append(contact.get('email', 'Not Available'))
+                companies.append(contact['company'])
+                sources.append(contact.get('source', 'API'))
             
-            df = pd.DataFrame(formatted_data, columns=[
-                "Date of Scraping", "Sr No", "City", "LinkedIn Profile Link",
-                "Name", "Mobile Number", "Email Id", "Organization Name", "Data Source"
-            ])
+            column_values = (
+                (today_iso,) * n_contacts,
+                tuple(range(1, n_contacts + 1)),
+                (selected_city,) * n_contacts,
+                tuple(links),
+                tuple(names),
+                tuple(phones),
+                tuple(emails),
+                tuple(companies),
+                tuple(sources),
+            )
+            result_columns = tuple(zip(RESULT_COLUMNS, column_values))
+            df = build_df(result_columns)
             
             # Clear progress
             progress_bar.empty()
             status_text.empty()
             
-            # Display results
-            st.success(f"✅ Found {len(df)} real professionals in {selected_city}")
-            
-            # Metrics
-            col1, col2, col3, col4 = st.columns(4)
-            with col1:
-                st.metric("👥 Total Contacts", len(df))
-            with col2:
-                emails_found = len(df[df['Email Id'] != 'Not Available'])
-                st.metric("📧 Emails Found", emails_found)
-            with col3:
-                st.metric("🏙️ City", selected_city)
-            with col4:
-                companies = df['Organization Name'].nunique()
-                st.metric("🏢 Companies", companies)
-            
-            # Results table
-            st.subheader("📋 Real Professional Contacts")
-            st.dataframe(df, use_container_width=True, height=400)
-            
-            # Download
-            csv_data = df.to_csv(index=False)
-            filename = f"real_contacts_{selected_city}_{datetime.date.today().strftime('%Y%m%d')}.csv"
-            
-            st.download_button(
-                label="📥 Download Real Contact Data",
-                data=csv_data,
-                file_name=filename,
-                mime="text/csv",
-                type="secondary"
-            )
-            
-            # Data quality info
-            with st.expander("📊 Data Quality Report"):
-                st.write(f"**Data Sources Used:** {', '.join([api for api, status in api_status.items() if status])}")
-                st.write(f"**Email Coverage:** {emails_found}/{len(df)} contacts ({emails_found/len(df)*100:.1f}%)")
-                st.write(f"**Phone Coverage:** {len(df[df['Mobile Number'] != 'Not Available'])}/{len(df)} contacts")
-                st.write(f"**LinkedIn Coverage:** 100% (search URLs provided)")
-                st.write(f"**Geographic Accuracy:** City-filtered via API")
+            # Keep the results across reruns so paging doesn't repeat the search;
+            # searched_at is when the contacts were fetched, even on a cache hit
+            st.session_state['search_results'] = {
+                'key': search_key,
+                'searched_at': fetched_at,
+                'df': df,
+                'csv': build_csv(result_columns),
+                'city': selected_city,
+                'filename': f"real_contacts_{selected_city}_{today.strftime('%Y%m%d')}.csv",
+                'sources': [api for api, status in api_status.items() if status]
+            }
+            st.session_state['results_page'] = 0
         
         else:
             progress_bar.empty()
             status_text.empty()
+            st.session_state.pop('search_results', None)
             st.warning("⚠️ No contacts found. Try adjusting your search criteria or check API quotas.")
 
+# Display results
+search_results = st.session_state.get('search_results')
+if search_results:
+    df = search_results['df']
+    results_city = search_results['city']
+    
+    st.success(f"✅ Found {len(df)} real professionals in {results_city}")
+    
+    # Summary counts, computed once for the metrics and the quality report
+    n_contacts = len(df)
+    emails_found = int(df['Email Id'].ne('Not Available').sum())
+    phones_found = int(df['Mobile Number'].ne('Not Available').sum())
+    n_companies = len(df['Organization Name'].cat.categories)
+    
+    # Metrics, rendered as one HTML block rather than four column widgets
+    metrics = (
+        ("👥 Total Contacts", n_contacts),
+        ("📧 Emails Found", emails_found),
+        ("🏙️ City", results_city),
+        ("🏢 Companies", n_companies),
+    )
+    metric_cards = ''.join(
+        f'<div class="metric-container"><div class="metric-label">{label}</div>'
+        f'<div class="metric-value">{value}</div></div>'
+        for label, value in metrics
+    )
+    st.markdown(f'<div class="metrics-row">{metric_cards}</div>', unsafe_allow_html=True)
+    
+    # Results table, paged so only the visible rows are sent to the browser
+    st.subheader("📋 Real Professional Contacts")
+    n_pages = -(-n_contacts // RESULTS_PAGE_SIZE)
+    page = min(st.session_state.setdefault('results_page', 0), n_pages - 1)
+    
+    if n_pages > 1:
+        prev_col, page_col, next_col = st.columns([1, 2, 1])
+        with prev_col:
+            st.button("◀ Previous", disabled=page == 0, use_container_width=True,
+                      on_click=change_results_page, args=(-1,))
+        with page_col:
+            st.caption(f"Page {page + 1} of {n_pages}")
+        with next_col:
+            st.button("Next ▶", disabled=page >= n_pages - 1, use_container_width=True,
+                      on_click=change_results_page, args=(1,))
+    
+    start = page * RESULTS_PAGE_SIZE
+    st.dataframe(df.iloc[start:start + RESULTS_PAGE_SIZE], use_container_width=True, height=400)
+    
+    # Download
+    st.download_button(
+        label="📥 Download Real Contact Data",
+        data=search_results['csv'],
+        file_name=search_results['filename'],
+        mime="text/csv",
+        type="secondary"
+    )
+    
+    # Data quality info
+    with st.expander("📊 Data Quality Report"):
+        st.markdown(
+            f"**Data Sources Used:** {', '.join(search_results['sources'])}\n\n"
+            f"**Email Coverage:** {emails_found}/{n_contacts} contacts ({emails_found/n_contacts*100:.1f}%)\n\n"
+            f"**Phone Coverage:** {phones_found}/{n_contacts} contacts\n\n"
+            "**LinkedIn Coverage:** 100% (search URLs provided)\n\n"
+            "**Geographic Accuracy:** City-filtered via API"
+        )
+
 # API Configuration Guide
 if not any(api_status.values()):
     st.markdown("---")